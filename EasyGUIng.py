@@ -30,28 +30,37 @@ NUM_OF_DATAPOINTS = 101    # default number of data points to plot
 MIN_EDIT_WIDTH = 100    # minimum width for line edit
 MAX_IMAGE_HEIGHT = 256    # maximum height for images in px
 SPACING = 12    # spacing between description box and calc/plot box
+SERIES_CACHE_SIZE = 32    # number of model results kept per tab
+PARALLEL_MIN_POINTS = 1000    # calculate a family in parallel threads above this total
+RASTERIZE_MIN_POINTS = 1000    # curves with more points are bitmaps in vector exports (svg, pdf)
 
 # Load external mathematic model as module in subfolder
 MODEL_FOLDER = 'model'
 
 """Init"""
+import functools
 import logging
+import re
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 # running in an executable bundle (True) or in a normal Python process (False)
 EXECUTABLE_BUNDLE = getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
 if EXECUTABLE_BUNDLE:
     DIRECTORY = Path(sys.executable).parent    # directory of executable
-    # BUG: bugfixes and improvements for executables:
-    import matplotlib.backends.backend_pdf    # make the 'Save the figure -> pdf' work
 else:
     DIRECTORY = Path(__file__).parent    # script directory
-# Get all model file paths (.py files in MODEL_FOLDER)
+# Get all model file paths (.py files in MODEL_FOLDER) and their images in one directory scan
 g_modeldir = Path(DIRECTORY, MODEL_FOLDER)
-g_modelpath_gen = g_modeldir.glob('*.py')   # is generator (from .glob) -> use only once
+g_modelfiles = sorted(g_modeldir.glob('*'))    # same tab order on every start and system
+g_modelpaths = [p_ for p_ in g_modelfiles if p_.match('*.py')]
 
 # Dynamic module import
-from importlib.machinery import SourceFileLoader
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+g_modelmtimes = {}    # {path: mtime} of the imported model files
 
 # Localisation
 import locale
@@ -62,29 +71,24 @@ from PySide6 import QtCore as qtc
 from PySide6 import QtGui as qtg
 from PySide6 import QtSvgWidgets as qts
 from PySide6 import QtWidgets as qtw    # only PySide6-Essentials are used
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import (
-    FigureCanvas, NavigationToolbar2QT as NavigationToolbar)
-# https://matplotlib.org/stable/gallery/user_interfaces/embedding_in_qt_sgskip.html
-plt.rcParams['axes.formatter.use_locale'] = True    # plot localisation
+# matplotlib is imported with the first plot, see loadMatplotlib
+mpl = plt = FigureCanvas = NavigationToolbar = None
 
 # Physical quantities
 import numpy as np
 import pint
-ureg = pint.UnitRegistry()
+try:
+    # keep the parsed unit definitions in the user's cache directory between runs
+    ureg = pint.UnitRegistry(cache_folder=':auto:')
+except Exception:
+    ureg = pint.UnitRegistry()    # e.g. cache directory not writable
 ureg.autoconvert_offset_to_baseunit = True    # °C input without OffsetUnitCalculusError
 # See https://pint.readthedocs.io/en/stable/user/nonmult.html for guidance.
-ureg.setup_matplotlib()    # https://pint.readthedocs.io/en/stable/plotting.html
 ureg.formatter.default_format = '~P'    # f'{u:~P}' pint short pretty
 ureg.mpl_formatter = '{:~P}'    # pint short pretty for matplotlib
 Q_ = ureg.Quantity
 
 # globals
-g_library_infos = ['Qt ' + qtc.QLibraryInfo.version().toString(),
-    'Matplotlib ' + mpl.__version__,
-    'Numpy ' + np.__version__,
-    'Pint ' + pint.__version__]
 g_mainWindow = None    # pointer to the main window
 
 class MainWindow(qtw.QMainWindow):
@@ -104,8 +108,7 @@ class MainWidget(qtw.QTabWidget):
         super().__init__()
 
         # Save and About button next to TabBar
-        icon = self.style().standardIcon(qtw.QStyle.SP_DialogSaveButton)    # built-in Qt icon
-        icon = qtg.QIcon.fromTheme(qtg.QIcon.ThemeIcon.DocumentSaveAs, icon)    # native icon
+        icon = themeIcon(qtg.QIcon.ThemeIcon.DocumentSaveAs, qtw.QStyle.SP_DialogSaveButton)
         key = qtg.QKeySequence.Save
         key_str = qtg.QKeySequence.listToString(qtg.QKeySequence.keyBindings(key))
         saveBtn = qtw.QPushButton(icon, '', toolTip=f'Daten exportieren ({key_str})')
@@ -125,18 +128,24 @@ class MainWidget(qtw.QTabWidget):
         self.setCornerWidget(box)
 
         # Import each model as a module and show as tab
-        for p_ in g_modelpath_gen:
-            name = p_.stem    # filename without extension
-            if name[:2] == 'f_':
-                # skip helper functions
-                continue
+        importlib.invalidate_caches()    # pick up newly added model files
+        # skip helper functions
+        paths = [p_ for p_ in g_modelpaths if p_.stem[:2] != 'f_']
+        # import in parallel, but create the widgets in the GUI thread
+        with ThreadPoolExecutor(max_workers=min(8, len(paths)) or 1) as executor:
+            modules = [(p_.stem, executor.submit(loadModel, p_)) for p_ in paths]
+        self.pendingModels = {}    # {placeholder widget: model}, see on_tab_changed
+        for name, future in modules:    # name is filename without extension
             try:
-                model = SourceFileLoader(name, str(p_)).load_module()
-                widget = PageWidget(model, name)
+                model = future.result()
+                PageWidget.ValidModel(model, name)    # check model integrity
             except Exception as ex:
                 error(f'Error in {name}:\n{type(ex).__name__}: {ex}')
             else:
-                self.addTab(widget, name)
+                # the PageWidget is created when the tab is opened for the first time
+                placeholder = qtw.QWidget()
+                self.pendingModels[placeholder] = model
+                self.addTab(placeholder, name)
         if self.count() == 0:
             error('No models loaded.')
             text = f' No models loaded from \n {g_modeldir} \n Check directory for .py files.'
@@ -151,6 +160,32 @@ class MainWidget(qtw.QTabWidget):
 
     def on_tab_changed(self, index: int):
         g_mainWindow.statusBar().clearMessage()
+        placeholder = self.widget(index)
+        if placeholder in self.pendingModels:
+            model = self.pendingModels.pop(placeholder)
+            name = self.tabText(index)
+            try:
+                widget = PageWidget(model, name)
+            except Exception as ex:
+                error(f'Error in {name}:\n{type(ex).__name__}: {ex}')
+                # skip the model like an invalid one at startup
+                self.blockSignals(True)
+                self.removeTab(index)
+                if self.count() == 0:
+                    text = f' No models loaded from \n {g_modeldir} \n Check directory for .py files.'
+                    self.addTab(qtw.QLabel(text), 'Error')
+                    self.existingPlots.append(True)    # nothing to calculate
+                self.blockSignals(False)
+                del self.existingPlots[index]
+                placeholder.deleteLater()
+                self.on_tab_changed(self.currentIndex())    # fill the tab shown instead
+                return
+            self.blockSignals(True)    # no on_tab_changed while replacing the tab
+            self.removeTab(index)
+            self.insertTab(index, widget, name)
+            self.setCurrentIndex(index)
+            self.blockSignals(False)
+            placeholder.deleteLater()
         if not self.existingPlots[index]:
             self.widget(index).calc()    # do point calculation on current tab
             self.widget(index).outputPlot.plot()    # do the plot on current tab
@@ -158,6 +193,9 @@ class MainWidget(qtw.QTabWidget):
 
     def on_saveBtn_clicked(self):
         """Export calculated data to .csv file"""
+        widget = self.currentWidget()
+        if not isinstance(widget, PageWidget):
+            return    # e.g. no model loaded
         fileFilter = ('CSV (Tab-separated) (*.csv)','Text (Tab-separated) (*.txt)',
             'CSV (Comma-separated) (*.csv)')
         path, selectedFilter = qtw.QFileDialog.getSaveFileName(self,
@@ -166,21 +204,25 @@ class MainWidget(qtw.QTabWidget):
             return
         delimiter = '\t' if selectedFilter in fileFilter[:2] else ','    # Tab- or Comma-separated
         # get data
-        widget = self.currentWidget()
         plots = widget.outputPlot.plots
-        input = np.array([widget.inputNames[k_] for k_ in plots[0].qty])
-        data = plots[0].x.magnitude
-        unit = [str(plots[0].x.units)]
-        for p_ in plots:
-            input = np.vstack((input, np.array([str(v_) for v_ in p_.qty.values()])))
-            data = np.vstack((data, p_.result.magnitude))
-            unit.append(str(p_.result.units))
-        input = input.transpose()
-        header = '\n'.join([delimiter.join(i_) for i_ in input.tolist()])
+        # one header line per input: name and its value in each plot
+        input = [[widget.inputNames[k_]] + [str(p_.qty[k_]) for p_ in plots] for k_ in plots[0].qty]
+        # one column per plot, filled in place (no temporary list of columns)
+        data = np.empty((plots[0].xMag.size, 1 + len(plots)), dtype=np.float64)
+        data[:, 0] = plots[0].xMag
+        for i_, p_ in enumerate(plots, start=1):
+            data[:, i_] = p_.resultMag
+        unit = [str(plots[0].x.units)] + [str(p_.result.units) for p_ in plots]
+        header = '\n'.join([delimiter.join(i_) for i_ in input])
         header += '\n' + delimiter.join(unit)
-        # save in double precision
-        np.savetxt(path, data.transpose(), fmt='%.14e',
-                   header=header, delimiter=delimiter, encoding='utf-8')
+        # save in double precision, formatting each row with one template
+        rowFormat = delimiter.join(['%.14e'] * data.shape[1]) + '\n'
+        with open(path, 'w', encoding='utf-8', buffering=1<<20) as f_:
+            if np.isfinite(data).all():
+                f_.writelines('# ' + l_ + '\n' for l_ in header.split('\n'))
+                f_.writelines(rowFormat % tuple(r_) for r_ in data.tolist())
+            else:
+                np.savetxt(f_, data, fmt='%.14e', header=header, delimiter=delimiter)
 
     def on_aboutBtn_clicked(self):
         """Open window with program information"""
@@ -192,7 +234,7 @@ class MainWidget(qtw.QTabWidget):
             ('Autor(en):', '<i>' + __Author__ + '</i>'),
             ('Lizenz:', __License__),
             ('Quelltext:', __Source__),
-            ('Bibliotheken:', '<br>'.join(g_library_infos))
+            ('Bibliotheken:', '<br>'.join(libraryInfos()))
             )
         qtw.QMessageBox.about(self, 'Über', htmlTable(table))
 
@@ -209,6 +251,11 @@ class PageWidget(qtw.QWidget):
             self.version = str(getattr(model, 'version', ''))
             self.option = getattr(model, 'option', {})
             self.option['output'] = self.option.get('output', '')    # key required
+            # calculate without pint: unitless = {'output': 'unit of the returned SI magnitude', ...}
+            self.unitless = dict((k_, ureg.Unit(v_)) for k_, v_ in getattr(model, 'unitless', {}).items())
+            # calculate a family in one call: batch = True if calculate broadcasts parameters
+            # given as column vectors (one row per plot) against the control variable
+            self.batch = bool(getattr(model, 'batch', False))
 
             # Required
             self.input = getattr(model, 'input')
@@ -220,28 +267,60 @@ class PageWidget(qtw.QWidget):
                 else:
                     self.option[k_] = tuple([str(i_) for i_ in v_])         
 
+    class PointWorker(qtc.QRunnable):
+        """Calculate the calculator's point in thread"""
+        class Signals(qtc.QObject):
+            completed = qtc.Signal(int, object, object)
+
+        def __init__(self, ref, qty: dict, opt: dict, generation: int):
+            super().__init__()
+            self.ref = ref    # reference PageWidget object
+            self.qty = qty
+            self.opt = opt
+            self.generation = generation
+            self.signals = self.Signals()
+
+        def run(self):
+            try:
+                y = self.ref.calc_series(None, self.qty, self.opt)
+            except Exception as ex:
+                y = ex    # report in GUI thread
+            self.signals.completed.emit(self.generation, self.qty, y)
+
     def __init__(self, model, name: str):
         super().__init__()
         model = self.ValidModel(model, name)    # check model integrity
         self.model = model
 
         # Get vars from model
-        self.inputNames, qtys, self.inputForOption = {}, {}, {}
+        self.inputNames, self.inputUnits, qtys, self.inputForOption = {}, {}, {}, {}
         for k_, v_ in model.input.items():
             # input['x'] = ('name', (min value, ..., max value), 'unit', output)
             self.inputNames[k_] = str(v_[0])
-            qtys[k_] = np.atleast_1d(Q_(v_[1], v_[2]))    # makes single entries iterable too
+            self.inputUnits[k_] = ureg.Unit(v_[2])    # parse unit string only once
+            # makes single entries iterable too (on the magnitude, no pint array dispatch)
+            qtys[k_] = Q_(np.atleast_1d(v_[1]), self.inputUnits[k_])
             if len(v_) > 3:
                 if type(v_[3]) is tuple:
                     self.inputForOption[k_] = v_[3]
                 else:
                     # a single entry is not a tuple, so make a tuple with one item
                     self.inputForOption[k_] = (v_[3],)
+        self.inputKeys = tuple(self.inputNames)    # row and plotXCombo index -> key
+        self.inputIndex = dict((k_, i_) for i_, k_ in enumerate(self.inputKeys))    # key -> index
         # first entry of (min value, ..., max value) sets unit
-        self.qtysUnit = dict((k_, qtys[k_].dimensionality) for k_ in qtys)
+        self.qtysUnit = dict((k_, u_.dimensionality) for k_, u_ in self.inputUnits.items())
         self.option = dict((k_, model.option[k_][0]) for k_ in model.option)
         self.plotX = model.plotX
         self.calcModel = model.calculate
+        self.dimensionless = ureg.dimensionless    # unit of plain model results, see calc_series
+        self.calcPoint = None    # (qty, y), None while calculating
+        self.calcGeneration = 0    # number of the latest calc request
+        self.inputGeneration = 0    # counts changes of plot inputs and options, see plot_pre
+        self.plotBusy = False
+        self.xBase = (None, None)    # last control variable and its base units, see calc_series
+        self.seriesCache = OrderedDict()    # least recently used model results
+        self.seriesLock = threading.Lock()    # calc_series also runs in CalcWorker
 
         # Description
         descBoxLayout = qtw.QVBoxLayout()
@@ -261,6 +340,10 @@ class PageWidget(qtw.QWidget):
         # default sizePolicy for QTextBrowser: Expanding
         descLayout.addWidget(label)    # description
         self.image = None
+        # image file names from the directory scan (exclude the .py files)
+        self.imageFiles = [f_ for f_ in g_modelfiles
+                           if f_.name.startswith(self.model.name) and not f_.match('*.py')]
+        self.imageCache = {}    # {option values: (file, svgAvailable, pixmap)}
         self.getImage()    # try to load an image
         if self.image:
             descLayout.addWidget(self.image)
@@ -269,9 +352,7 @@ class PageWidget(qtw.QWidget):
         descBoxLayout.addLayout(descLayout)
 
         # Input/Output
-        validator = qtg.QRegularExpressionValidator('[^,]*', self)
-        """Do not allow commas"""
-        # [^]: any char but, *: any times (empty -> setText(placeholderText()))
+        validator = noCommaValidator()
 
         for k_, v_ in model.option.items():
             if k_ != 'output' and len(v_) > 1:
@@ -283,9 +364,13 @@ class PageWidget(qtw.QWidget):
         calcBox = qtw.QGroupBox('Rechner')
         self.calcBoxLayout = qtw.QFormLayout(calcBox)
         self.calcInputs = {}
+        calcBox.setUpdatesEnabled(False)    # one layout update for all rows
         for k_, v_ in qtys.items():
-            mean = np.mean((np.min(v_.magnitude), np.max(v_.magnitude)))
-            mean = Q_(np.round(mean, decimals=14), v_.units)    # truncate double precision
+            mag = v_.magnitude    # 1d, see qtys
+            mean = 0.5 * (float(mag.min()) + float(mag.max()))
+            if not mean.is_integer():
+                mean = np.round(mean, decimals=14)    # truncate double precision
+            mean = Q_(mean, v_.units)
             ed = qtw.QLineEdit(f'{mean}', toolTip=k_)
             ed.setPlaceholderText(f'{mean}')
             ed.setClearButtonEnabled(True)
@@ -294,6 +379,7 @@ class PageWidget(qtw.QWidget):
             ed.editingFinished.connect(self.on_calcEdit_finished)
             self.calcInputs[k_] = ed
             self.calcBoxLayout.addRow(self.inputNames[k_], ed)    # label: 'name'
+        calcBox.setUpdatesEnabled(True)
 
         line = qtw.QFrame(frameShape=qtw.QFrame.HLine)
         line.setStyleSheet('QFrame {color: lightgrey}')
@@ -318,10 +404,14 @@ class PageWidget(qtw.QWidget):
         calcLayout.addWidget(self.outputLine)
         calcLayout.addWidget(self.plotCalc)
         self.calcBoxLayout.addRow(calcLayout)
+        # coalesce rapid edits (e.g. tabbing through the fields) into one calculation
+        self.calcTimer = qtc.QTimer(self, singleShot=True, interval=20)
+        self.calcTimer.timeout.connect(self.calc)
 
         plotBox = qtw.QGroupBox('Diagramm')
         self.plotBoxLayout = qtw.QFormLayout(plotBox)
         self.plotInputs = {}
+        plotBox.setUpdatesEnabled(False)    # one layout update for all rows
         for k_ in qtys:
             text = '; '.join([f'{q_}' for q_ in qtys[k_]])    # input delimiter
             ed = qtw.QLineEdit(text, toolTip=k_)
@@ -333,13 +423,19 @@ class PageWidget(qtw.QWidget):
             ed.returnPressed.connect(self.on_plotEdit_returnPressed)
             self.plotInputs[k_] = ed
             self.plotBoxLayout.addRow(self.inputNames[k_], ed)    # label: 'name'
+        plotBox.setUpdatesEnabled(True)
 
         line = qtw.QFrame(frameShape=qtw.QFrame.HLine)
         line.setStyleSheet('QFrame {color: lightgrey}')  
         self.plotBoxLayout.addRow(line)
 
+        # coalesce rapid changes (e.g. scrolling the number of points) into one input check
+        self.inputTimer = qtc.QTimer(self, singleShot=True, interval=50)
+        self.inputTimer.timeout.connect(self.plot_checkInputs)
+
         self.plotXCombo = qtw.QComboBox(toolTip='Laufvariable')
         self.plotXCombo.addItems(self.inputNames.values())
+        self.plotXItems = [self.plotXCombo.model().item(i_) for i_ in range(len(self.inputKeys))]
         self.plotXCombo.setCurrentText(self.inputNames[self.plotX])
         self.plotXCombo.currentIndexChanged.connect(self.on_plotXCombo_changed)
         self.plotNumOfPts = qtw.QSpinBox(toolTip='Datenpunkte', minimum=2, maximum=10001)
@@ -356,17 +452,17 @@ class PageWidget(qtw.QWidget):
         self.plotMax.stateChanged.connect(self.plot_updatePending)
 
         # Input/Output: Plot
-        icons = (self.style().standardIcon(qtw.QStyle.SP_BrowserReload),
-                 self.style().standardIcon(qtw.QStyle.SP_BrowserStop))
-        # built-in Qt icons as fallback for native icons
-        self.plotBtn_icons = (qtg.QIcon.fromTheme(qtg.QIcon.ThemeIcon.SyncSynchronizing, icons[0]),
-                              qtg.QIcon.fromTheme(qtg.QIcon.ThemeIcon.MediaPlaybackStop, icons[1]))
+        self.plotBtn_icons = (themeIcon(qtg.QIcon.ThemeIcon.SyncSynchronizing, qtw.QStyle.SP_BrowserReload),
+                              themeIcon(qtg.QIcon.ThemeIcon.MediaPlaybackStop, qtw.QStyle.SP_BrowserStop))
         key = qtg.QKeySequence.Refresh
         key_str = qtg.QKeySequence.listToString(qtg.QKeySequence.keyBindings(key))
         self.plotBtn = qtw.QPushButton(self.plotBtn_icons[0], '', toolTip=f'Zeichne ({key_str})')
         self.plotBtn.setDefault(True)
         self.plotBtn.setShortcut(qtg.QKeySequence.Refresh)
         self.plotBtn.clicked.connect(self.on_plotBtn_clicked)
+        # coalesce rapid option changes into one plot, the button plots immediately
+        self.plotTimer = qtc.QTimer(self, singleShot=True, interval=50)
+        self.plotTimer.timeout.connect(self.on_plotBtn_clicked)
 
         plotStateOkay = qtw.QLabel('✔', styleSheet='QLabel {color: green;}')
         plotStateChgd = qtw.QLabel(' !', styleSheet='QLabel {color: DarkOrange; font-weight:bold;}')
@@ -418,6 +514,7 @@ class PageWidget(qtw.QWidget):
         layout.addLayout(sublayout)
         layout.addWidget(self.outputPlot)
 
+        self.parsedInputs = {}    # {QLineEdit: (text, quantities, valid units)}, see checkInputs
         self.calcInputQtys = self.checkInputs(self.calcInputs)
         """Dict entries consist of a list with one quantity Q_"""
         self.plotInputQtys = self.checkInputs(self.plotInputs)
@@ -426,43 +523,121 @@ class PageWidget(qtw.QWidget):
     def checkInputs(self, inputs: dict):
         r_ = {}
         for k_, v_ in inputs.items():
-            texts = [s_.strip() for s_ in v_.text().split(';')]    # input delimiter: ;
-            # split always returns a list, strip removes leading/trailing spaces
-            r_[k_] = [Q_(s_) for s_ in texts if s_ != '']    # ignore empty entries
-            if all(q_.dimensionality == self.qtysUnit[k_] for q_ in r_[k_]):
-                self.plotBtn.setEnabled(True)
-                g_mainWindow.statusBar().clearMessage()
-            else:
+            text = v_.text()
+            if self.parsedInputs.get(v_, (None,))[0] != text:
+                # parse and check only edited texts
+                texts = [s_.strip() for s_ in text.split(';')]    # input delimiter: ;
+                # split always returns a list, strip removes leading/trailing spaces
+                qtys = [parseQuantity(s_) for s_ in texts if s_ != '']    # ignore empty entries
+                valid = all(q_.dimensionality == self.qtysUnit[k_] for q_ in qtys)
+                self.parsedInputs[v_] = (text, qtys, valid)
+            if not self.parsedInputs[v_][2]:
                 self.plotBtn.setEnabled(False)
-                raise DimensionalityException(f'{k_}: [{v_.text()}]')
+                raise DimensionalityException(f'{k_}: [{text}]')
+            r_[k_] = list(self.parsedInputs[v_][1])
+        if r_:
+            self.plotBtn.setEnabled(True)
+            g_mainWindow.statusBar().clearMessage()
         if not self.plotX:
             self.plotBtn.setEnabled(False)
         return r_
 
     def calc(self):
+        """Calculate with simple threading for responsive GUI, the latest request wins"""
         qty = dict((k_, q_[0]) for k_, q_ in self.calcInputQtys.items())
-        y = self.calc_series(None, qty, self.option)
+        self.calcGeneration += 1
+        self.calcPoint = None    # pending
+        worker = PageWidget.PointWorker(self, qty, self.option.copy(), self.calcGeneration)
+        worker.signals.completed.connect(self.calc_post)
+        qtc.QThreadPool.globalInstance().start(worker)
+
+    def calc_post(self, generation: int, qty: dict, y):
+        """Continue calc()"""
+        if generation != self.calcGeneration:
+            return    # outdated
+        if isinstance(y, Exception):
+            error(f'Fehler in Modellrückgabe:\n{type(y).__name__}: {y}')
+            return
         y = y.item()    # possible 1d ndarray to scalar
         self.calcPoint = (qty , y)    # with all possible x values
         self.outputLine.setText(f'{y:.9g~P}')
+        if self.outputPlot.lines and not (self.plotBusy or self.plotTimer.isActive()):
+            # otherwise the coming plot marks the point (e.g. with new output units)
+            self.on_plotCalc_stateChanged(self.plotCalc.checkState())
 
     def calc_series(self, x, qty: dict, opt: dict):
         """Pass a normalized data series (control variable x, parameters) to the model"""
-        qty = dict((k_, q_.to_base_units()) for k_, q_ in qty.items())
+        key = (self.plotX, tuple((k_, quantityKey(q_)) for k_, q_ in qty.items()),
+               tuple(opt.items()), None if x is None else quantityKey(x))
+        with self.seriesLock:
+            if key in self.seriesCache:
+                self.seriesCache.move_to_end(key)
+                return self.seriesCache[key]
+        qty = dict((k_, toBaseUnits(q_)) for k_, q_ in qty.items())
         if self.plotX:
-            qty[self.plotX] = np.atleast_1d(qty[self.plotX]) if x is None else x.to_base_units()
+            if x is None:
+                q_ = qty[self.plotX]
+                qty[self.plotX] = Q_(np.atleast_1d(q_.magnitude), q_.units)
+            else:
+                # all plots of a family share the same x: convert only once
+                xBase = self.xBase
+                if xBase[0] is not x:
+                    xBase = self.xBase = (x, toBaseUnits(x))
+                qty[self.plotX] = xBase[1]
         # control variable is always an array that can be indexed
-        result = self.calcModel(Q_, qty, opt)
+        unit = self.model.unitless.get(opt['output'])
+        if unit is None:
+            result = self.calcModel(Q_, qty, opt)
+        else:
+            # opt-in: the model gets the magnitudes in base units and returns a magnitude
+            qty = dict((k_, q_.magnitude) for k_, q_ in qty.items())
+            result = Q_(self.calcModel(Q_, qty, opt), unit)
         if not isinstance(result, Q_):
             # e.g. in case of dimensionless exponential operations y is float or numpy.ndarray
-            result = Q_(result)
+            result = Q_(result, self.dimensionless)
+        with self.seriesLock:
+            self.seriesCache[key] = result
+            if len(self.seriesCache) > SERIES_CACHE_SIZE:
+                self.seriesCache.popitem(last=False)    # drop least recently used
         return result
 
+    def calc_batch(self, plots: list):
+        """Calculate the plots of a family in one call of a broadcasting model (model.batch)"""
+        x, opt = plots[0].x, plots[0].opt
+        qty = {}
+        for k_, q_ in plots[0].qty.items():
+            if all(str(p_.qty[k_]) == str(q_) for p_ in plots):
+                qty[k_] = q_    # same for all plots
+            else:
+                # column vector, one row per plot
+                values = [p_.qty[k_].m_as(q_.units) for p_ in plots]
+                qty[k_] = Q_(np.array(values)[:, np.newaxis], q_.units)
+        result = self.calc_series(x, qty, opt)
+        rows = np.ascontiguousarray(np.broadcast_to(result.magnitude, (len(plots), x.size)))
+        return [Q_(r_, result.units) for r_ in rows]
+
     def getImage(self):
+        """Show image corresponding to model.name and optional numbering from option"""
+        key = tuple(self.option.values())
+        if key not in self.imageCache:
+            self.imageCache[key] = self.loadImage()    # read and scale only once
+        file, svgAvailable, pixmap = self.imageCache[key]
+        if not svgAvailable and pixmap.isNull():
+            return
+
+        if not self.image:
+            # create image widget if necessary
+            self.image = qts.QSvgWidget() if svgAvailable else qtw.QLabel()
+        if svgAvailable:
+            self.image.load(file)
+            self.image.renderer().setAspectRatioMode(qtc.Qt.KeepAspectRatio)
+        else:
+            self.image.setPixmap(pixmap)
+
+    def loadImage(self):
         """Get image corresponding to model.name and optional numbering from option"""
         validNums = []
-        # get image file names (exclude the .py files which end with 'y')
-        for f_ in g_modeldir.glob(self.model.name + '*[!y]'):
+        for f_ in self.imageFiles:
             numFromFile = f_.stem.replace(self.model.name, '')
             num = ''
             for i_ in range(len(numFromFile)):
@@ -475,32 +650,32 @@ class PageWidget(qtw.QWidget):
             validNums.append(num)
         num = max(validNums, key=len) if validNums else ''    # get most specific numbering
 
-        # get file or return
-        file = Path(g_modeldir, self.model.name + num)
-        svgAvailable = Path(file,'.svg').exists()
-        pixmap = qtg.QPixmap(file)    # loader guesses the image file format
-        if not svgAvailable and pixmap.isNull():
-            return
-
-        if not self.image:
-            # create image widget if necessary
-            self.image = qts.QSvgWidget() if svgAvailable else qtw.QLabel()
-        if svgAvailable:
-            self.image.load(file + '.svg')
-            self.image.renderer().setAspectRatioMode(qtc.Qt.KeepAspectRatio)
-        else:
-            pixmap.setDevicePixelRatio(self.devicePixelRatioF())    # use high-DPI displays
-            if pixmap.height() > MAX_IMAGE_HEIGHT:
-                pixmap = pixmap.scaledToHeight(MAX_IMAGE_HEIGHT, qtc.Qt.SmoothTransformation)
-            self.image.setPixmap(pixmap)
+        # get file, prefer vector graphics
+        files = [f_ for f_ in self.imageFiles if f_.stem == self.model.name + num]
+        files.sort(key=lambda f_: f_.suffix.lower() != '.svg')
+        for f_ in files:
+            if f_.suffix.lower() == '.svg':
+                return str(f_), True, qtg.QPixmap()
+            # loader guesses the image file format
+            pixmap = loadPixmap(str(f_), f_.stat().st_mtime, self.devicePixelRatioF())
+            if not pixmap.isNull():
+                return str(f_), False, pixmap
+        return '', False, qtg.QPixmap()
 
     def plot_isBusy(self, isBusy: bool):
         i_ = int(isBusy==True)    # bool to int
+        self.plotBusy = isBusy
         self.plotBtn.setEnabled(not isBusy)
         self.plotBtn.setIcon(self.plotBtn_icons[i_])
         self.plotState.setCurrentIndex(i_)
 
     def plot_updatePending(self):
+        self.inputTimer.start()    # restart on every change
+
+    def plot_checkInputs(self):
+        """Continue plot_updatePending()"""
+        self.inputTimer.stop()
+        self.inputGeneration += 1
         self.plotInputQtys = self.checkInputs(self.plotInputs)
         self.plotState.setCurrentIndex(2)    # set QStackedWidget
 
@@ -509,58 +684,68 @@ class PageWidget(qtw.QWidget):
         for k_, v_ in self.inputForOption.items():
             # at least one common element
             self.inputRelevance[k_] = bool( set(self.option.values()) & set(v_) )
-        listOfinputKey = list(self.inputNames.keys())
         for k_, v_ in self.inputRelevance.items():
-            i_ = listOfinputKey.index(k_)
+            i_ = self.inputIndex[k_]
             self.calcBoxLayout.setRowVisible(i_, v_)
             self.plotBoxLayout.setRowVisible(i_, v_)
             if not v_ and self.plotXCombo.currentIndex() == i_:
                 self.plotXCombo.setCurrentIndex(-1)    # reset to no item set
-            self.plotXCombo.model().item(i_).setEnabled(v_)
+            item = self.plotXItems[i_]
+            item.setEnabled(v_)
             # BUG fix for Qt >= 6.5(.1): there is no visualization of disabled entries
-            font = self.plotXCombo.model().item(i_).font()
+            font = item.font()
             font.setItalic(not v_)
-            self.plotXCombo.model().item(i_).setFont(font)
+            item.setFont(font)
 
     def on_calcEdit_finished(self):
         ed = self.sender()
         if not ed.text():
             ed.setText(ed.placeholderText())    # fill with default values
+        if self.parsedInputs[ed][0] == ed.text() and self.parsedInputs[ed][2]:
+            return    # focus left without changes (invalid input is reported again)
         self.calcInputQtys = self.checkInputs(self.calcInputs)
-        self.calc()
-        self.on_plotCalc_stateChanged(self.plotCalc.checkState())
+        self.calcTimer.start()    # restart on every edit
 
     def on_optionCombos_changed(self, text: str):
         k_ = self.sender().toolTip()
         self.option[k_] = text
+        self.inputGeneration += 1
         self.getImage()
         self.update_rowVisibility()
         self.calc()
         if k_ == 'output':
-            self.on_plotBtn_clicked()
+            self.plotTimer.start()
         else:
             self.plot_updatePending()
 
     def on_plotCalc_stateChanged(self, state):
         # BUG of Pyside6: stateChanged state is int instead of CheckState object
         state = self.plotCalc.checkState()
+        calcMark = self.outputPlot.calcMark
+        if calcMark[0] == state and calcMark[1] is self.calcPoint:
+            return    # marker is up to date
         self.outputPlot.markCalculation(state)    # does not replot lines
-        self.outputPlot.ax.figure.canvas.draw()
+        self.outputPlot.blit()
 
     def on_plotEdit_finished(self):
         ed = self.sender()
         if not ed.text():
             ed.setText(ed.placeholderText())    # fill with default values
+        if self.parsedInputs[ed][0] == ed.text() and self.parsedInputs[ed][2]:
+            return    # focus left without changes (invalid input is reported again)
         self.plot_updatePending()
 
     def on_plotEdit_returnPressed(self):
         self.on_plotBtn_clicked()
 
     def on_plotXCombo_changed(self, index: int):
-        self.plotX = list(self.inputNames.keys())[index] if index != -1 else ''
+        self.plotX = self.inputKeys[index] if index != -1 else ''
         self.plot_updatePending()
 
     def on_plotBtn_clicked(self):
+        self.plotTimer.stop()    # a pending delayed plot is done now
+        if self.inputTimer.isActive():
+            self.plot_checkInputs()    # plot the latest inputs
         if self.plotX:
             self.outputPlot.plot()
 
@@ -568,30 +753,60 @@ class ModelPlot(qtw.QWidget):
     """The plot part of the model's GUI"""
     
     class PlotData():
-        def __init__(self, x, qty, opt):
+        def __init__(self, x, qty, opt, key=None):
             self.x = x
             self.qty = qty
             self.opt = opt
+            self.key = key or self.fingerprint((x.magnitude.tobytes(), str(x.units)), qty,
+                                               tuple(opt.items()))
             self.result = None
+            # plain float64 data without pint (e.g. for extrema and export)
+            self.xMag = np.ascontiguousarray(x.magnitude, dtype=np.float64)
+            self.resultMag = None
+
+        def setResult(self, result):
+            self.resultMag = np.ascontiguousarray(result.magnitude, dtype=np.float64)
+            self.result = result
+
+        @staticmethod
+        def fingerprint(xKey, qty: dict, optKey: tuple):
+            """Hashable content of the inputs, compared to detect changes"""
+            return (xKey, optKey, tuple((k_, str(q_)) for k_, q_ in qty.items()))
     
     class CalcWorker(qtc.QRunnable):
-        """Calculate new PlotData in thread"""
+        """Calculate new PlotData in thread, the last worker of a plot signals completion"""
         class Signals(qtc.QObject):
             completed = qtc.Signal()
+        lock = threading.Lock()    # for the shared counters
         
-        def __init__(self, ref):
+        def __init__(self, ref, plots: list, pending: list, signals):
             super().__init__()
             self.ref = ref    # reference ModelPlot object
-            self.signals = self.Signals()
+            self.plots = plots    # PlotData, calculated one after another or in one call (model.batch)
+            self.pending = pending    # [number of unfinished workers], shared
+            self.signals = signals    # shared
 
         def run(self):
-            for p_ in self.ref.plots:
-                if p_.result is None:
-                    p_.result = self.ref.parent().calc_series(p_.x, p_.qty, p_.opt)
-            self.signals.completed.emit()
+            plots = self.plots
+            try:
+                if len(plots) > 1 and self.ref.page.model.batch:
+                    for p_, r_ in zip(plots, self.ref.page.calc_batch(plots)):
+                        p_.setResult(r_)
+                else:
+                    for p_ in plots:
+                        p_.setResult(self.ref.page.calc_series(p_.x, p_.qty, p_.opt))
+            finally:
+                # plot_post also reports a missing result
+                with self.lock:
+                    self.pending[0] -= 1
+                    last = self.pending[0] == 0
+                if last:
+                    self.signals.completed.emit()
 
     def __init__(self, parent: qtw.QWidget):
         super().__init__(parent)
+        self.page = parent    # PageWidget, saves the Qt parent() lookups
+        loadMatplotlib()
 
         layout = qtw.QVBoxLayout(self)
         px = 1/plt.rcParams['figure.dpi']  # pixel in inches
@@ -612,89 +827,224 @@ class ModelPlot(qtw.QWidget):
         # For the cursor to remain responsive you must keep a reference to it.
         # Set useblit=True on most backends for enhanced performance.
         self.cursor = mpl.widgets.Cursor(self.ax, useblit=True, color='grey', linewidth=0.5)
+        # keep the cursor lines out of ax.lines (data limits, extrema)
+        self.cursor.lineh.remove()
+        self.cursor.linev.remove()
+        self.background = None    # figure without animated artists
+        canvas.mpl_connect('draw_event', self.on_draw)
+        self.ax.callbacks.connect('xlim_changed', self.on_limits_changed)
+        self.ax.callbacks.connect('ylim_changed', self.on_limits_changed)
 
         self.plots = []    # PlotData
+        self.xLast = (None, None)    # ((start, stop, num), x) of plot_pre
+        self.preGeneration = None    # page.inputGeneration of the last plot_pre
+        self.lines = []    # Line2D of plots, reused by plot_post
+        self.extremaLines = [None, None]    # Line2D of min and max markers, see markExtremum
+        self.axisUnits = None    # (x units, y units) of self.lines
         self.overlay = []    # annotations to remove
+        self.calcMark = (None, None)    # (state, calcPoint) shown by markCalculation
+        self.legendDirty = False    # labeled lines changed, see updateLegend
+        self.drawn = ([], None)    # (results, extrema states) shown by plot_post
 
     def plot(self):
         """Plot with simple threading for responsive GUI"""
-        self.parent().plot_isBusy(True)
         try:
             self.plot_pre()
         except Exception as ex:
             error(str(ex))
-            self.parent().plot_isBusy(False)
+            self.page.plot_isBusy(False)
         else:
-            worker = ModelPlot.CalcWorker(self)
-            worker.signals.completed.connect(self.plot_post)
-            qtc.QThreadPool.globalInstance().start(worker)
+            plots = [p_ for p_ in self.plots if p_.result is None]
+            if not plots:
+                self.plot_post()    # nothing to calculate
+                return
+            self.page.plot_isBusy(True)
+            if (self.page.model.batch
+                    or len(plots) * self.page.plotNumOfPts.value() <= PARALLEL_MIN_POINTS):
+                # the whole family in one model call or in one thread (small plots)
+                groups = [plots]
+            else:
+                groups = [[p_] for p_ in plots]    # independent plots are calculated in parallel
+            self.calcSignals = ModelPlot.CalcWorker.Signals()    # keep until completion
+            self.calcSignals.completed.connect(self.plot_post)
+            pending = [len(groups)]
+            for g_ in groups:
+                worker = ModelPlot.CalcWorker(self, g_, pending, self.calcSignals)
+                qtc.QThreadPool.globalInstance().start(worker)
 
     def plot_pre(self):
         """Plot preparation"""
-        parent = self.parent()
+        parent = self.page
+        if parent.inputGeneration == self.preGeneration:
+            return    # nothing changed, keep the plots
         self.legendKeys = []
-        family, qty = {}, {}
+        family = {}
         for k_, q_ in parent.plotInputQtys.items():
             if not parent.inputRelevance.get(k_, True):
                 continue
             # persistent and visible optional inputs (see update_rowVisibility):
             if k_ == parent.plotX:
-                x = np.linspace(q_[0], q_[-1], parent.plotNumOfPts.value())
+                key = (str(q_[0]), str(q_[-1]), parent.plotNumOfPts.value())
+                if key != self.xLast[0]:
+                    # reuse the unchanged control variable (do not modify in place)
+                    self.xLast = (key, linspace(q_[0], q_[-1], key[2]))
+                x = self.xLast[1]
             elif len(set(q_)) == 1:
                 family[k_] = [q_[0]]    # k_ not containing different values
             else:
                 family[k_] = q_
                 self.legendKeys.append(k_)
 
-        numOfPlots = 1
-        if family:
-            # shortest family containing different values
-            numOfPlots = min([len(v_) for v_ in family.values() if len(v_) > 1])
+        # shortest family containing different values
+        numOfPlots = min([len(v_) for v_ in family.values() if len(v_) > 1], default=1)
 
         if numOfPlots <= len(self.plots):
             self.plots = self.plots[:numOfPlots]    # shorten or keep list
         else:
             self.plots.extend([None] * (numOfPlots-len(self.plots)))    # expand list
-        opt = parent.option
+        opt = parent.option.copy()    # one snapshot shared by the new plots
+        # shared by all plots: x is defined by (start, stop, num), see above
+        xKey, optKey = self.xLast[0], tuple(opt.items())
+        # one value per plot for every key (in order of family), single values repeated
+        columns = [(f_, v_ if len(v_) > 1 else v_ * numOfPlots) for f_, v_ in family.items()]
         for n_, p_ in enumerate(self.plots):
             # update plots if necessary
-            for f_ in family:
-                if len(family[f_]) == 1:
-                    qty[f_] = family[f_][0]
-                else:
-                    qty[f_] = family[f_][n_]
-            same = True if p_ else False
-            same = np.equal(p_.opt, opt).all() if same else False    # opt equal
-            same = np.equal(p_.qty, qty).all() if same else False    # qty equal
-            same = np.equal(p_.x, x).all() if same and len(p_.x)==len(x) else False    # x equal
-            # BUG: numpy.array_equal not implemented for pint.util.Quantity
-            if not same:
-                self.plots[n_] = ModelPlot.PlotData(x, qty.copy(), opt.copy())
+            qty = dict((f_, v_[n_]) for f_, v_ in columns)
+            key = ModelPlot.PlotData.fingerprint(xKey, qty, optKey)
+            if not p_ or p_.key != key:
+                self.plots[n_] = ModelPlot.PlotData(x, qty, opt, key)
+        self.preGeneration = parent.inputGeneration
 
     def plot_post(self):
         """Continue plot()"""
-        parent = self.parent()
-        self.ax.clear()    # clear old plots
-
+        parent = self.page
+        labels = (self.ax.get_xlabel(), self.ax.get_ylabel())
+        results = [p_.result for p_ in self.plots]
+        extrema = (parent.plotMin.checkState(), parent.plotMax.checkState())
+        if (extrema == self.drawn[1] and len(results) == len(self.drawn[0])
+                and all(r_ is d_ for r_, d_ in zip(results, self.drawn[0]))
+                and self.ax.get_autoscale_on()):
+            # same curves and extrema as shown (and not zoomed): only the marker may be new
+            self.markCalculation(parent.plotCalc.checkState())
+            self.blit()
+            parent.plot_isBusy(False)
+            return
+        axisUnits = (self.plots[0].x.units, getattr(self.plots[0].result, 'units', None))
+        # reuse the lines and extrema markers, remove other markers and annotations
+        # (see markExtremum, markCalculation)
+        keep = self.lines + [l_ for l_ in self.extremaLines if l_]
+        for a_ in [l_ for l_ in self.ax.lines if l_ not in keep] + self.ax.texts:
+            a_.remove()
+        for l_ in keep[len(self.lines):]:
+            l_.set_data([], [])    # no old extrema in relim, refilled by markExtremum
+        if self.ax.get_legend():
+            self.ax.get_legend().remove()
+        self.overlay = []
+        self.calcMark = (None, None)
+        for l_ in self.lines[len(self.plots):]:
+            l_.remove()    # surplus lines
+        del self.lines[len(self.plots):]
+
+        rasterized = self.plots[0].x.size > RASTERIZE_MIN_POINTS    # all plots share x
         try:
-            for p_ in self.plots:
-                self.ax.plot(p_.x, p_.result, '-', label=self.legendText(p_.qty))
+            if axisUnits != self.axisUnits:
+                # empty the reused lines first: set_units reconverts their data to both
+                # axes, new x with old y units would fail; new lines take these units
+                for l_ in self.lines:
+                    l_.set_data([], [])
+                self.ax.xaxis.set_units(axisUnits[0])
+                self.ax.yaxis.set_units(axisUnits[1])
+                self.axisUnits = axisUnits
+            for l_, p_ in zip(self.lines, self.plots):
+                l_.set_data(p_.x, p_.result)    # converted on first use
+                l_.set_label(self.legendText(p_.qty))
+                l_.set_rasterized(rasterized)
+            for n_, p_ in enumerate(self.plots[len(self.lines):], start=len(self.lines)):
+                # same colors as plotting on cleared axes
+                self.lines += self.ax.plot(p_.x, p_.result, '-', label=self.legendText(p_.qty),
+                                           color=f'C{n_}', animated=True, rasterized=rasterized)
+            self.ax.relim()    # also converts the new data
+            self.ax.set_autoscale_on(True)    # reset zoom like ax.clear()
+            self.ax.autoscale_view()
         except Exception as ex:
+            self.clearAxes()
             error(f'Fehler in Modellrückgabe:\n{type(ex).__name__}: {ex}')
         else:
-            self.ax.set_xlabel(f"{self.parent().plotX} ({self.ax.xaxis.get_units()})")
-            self.ax.set_ylabel(f"{self.parent().option['output']} ({self.ax.yaxis.get_units()})")
-            if self.legendKeys:
-                self.ax.legend()
+            xlabel = f"{self.page.plotX} ({self.ax.xaxis.get_units()})"
+            ylabel = f"{self.page.option['output']} ({self.ax.yaxis.get_units()})"
+            if (xlabel, ylabel) != labels:
+                self.ax.set_xlabel(xlabel)    # set only if changed, see blit
+                self.ax.set_ylabel(ylabel)
+            self.legendDirty = True    # legend is built by markCalculation
             self.markExtremum(parent.plotMin.checkState(), parent.plotMax.checkState())
             self.markCalculation(parent.plotCalc.checkState())
+            self.drawn = (results, extrema)
         finally:
-            self.ax.figure.canvas.draw()
+            if labels != (self.ax.get_xlabel(), self.ax.get_ylabel()):
+                self.background = None    # axis labels or units changed
+            self.blit()    # only the data if the background is still valid
             parent.plot_isBusy(False)
 
+    def clearAxes(self):
+        """Clear the axes and forget the lines"""
+        self.ax.clear()    # also replaces ax.callbacks
+        self.ax.callbacks.connect('xlim_changed', self.on_limits_changed)
+        self.ax.callbacks.connect('ylim_changed', self.on_limits_changed)
+        self.lines = []
+        self.extremaLines = [None, None]
+        self.axisUnits = None
+        self.drawn = ([], None)
+
+    def on_limits_changed(self, ax):
+        """Hide lines outside the view (e.g. after zoom or pan) to skip drawing them"""
+        (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+        for l_ in self.lines:
+            xy = l_.get_xydata()    # cached data in axis units
+            if not xy.size:
+                continue
+            outside = (xy[:, 0].max() < x0 or xy[:, 0].min() > x1
+                       or xy[:, 1].max() < y0 or xy[:, 1].min() > y1)
+            l_.set_visible(not outside)    # NaN bounds compare False: keep visible
+
+    def animatedArtists(self):
+        """Artists excluded from the background and drawn separately for blitting"""
+        # data lines, markers and annotations; the legend last to stay on top
+        artists = self.ax.lines + self.ax.texts + [self.ax.get_legend()]
+        return [a_ for a_ in artists if a_ and a_.get_animated()]
+
+    def on_draw(self, event):
+        """Save the background after a full draw and add the animated artists"""
+        canvas = self.ax.figure.canvas
+        if canvas.is_saving():
+            return    # Axes.draw includes the animated artists when saving the figure
+        if canvas.supports_blit:
+            self.background = canvas.copy_from_bbox(self.ax.figure.bbox)
+            self.backgroundLim = (self.ax.get_xlim(), self.ax.get_ylim())
+        for a_ in self.animatedArtists():
+            a_.draw(event.renderer)
+        if self.cursor.useblit:
+            # the cursor restores its background on mouse move
+            self.cursor.background = canvas.copy_from_bbox(self.ax.bbox)
+
+    def blit(self):
+        """Redraw only the animated artists on top of the saved background"""
+        canvas = self.ax.figure.canvas
+        if (self.background is None or self.legendKeys
+                or self.backgroundLim != (self.ax.get_xlim(), self.ax.get_ylim())):
+            # animated artists also change the legend or the autoscaled limits
+            self.background = None    # saved again by on_draw
+            canvas.draw_idle()    # coalesces bursts of updates
+            return
+        canvas.restore_region(self.background)
+        for a_ in self.animatedArtists():
+            self.ax.draw_artist(a_)
+        canvas.blit(self.ax.figure.bbox)
+        if self.cursor.useblit:
+            self.cursor.background = canvas.copy_from_bbox(self.ax.bbox)
+
     def legendText(self, qty: dict):
         """Localized Quantities (e.g. decimal separator) for legend"""
-        texts = [locale.localize(str(v_)) for k_, v_ in qty.items() if k_ in self.legendKeys]
+        texts = [locale.localize(str(qty[k_])) for k_ in self.legendKeys]    # same order as qty
         return ', '.join(texts)
 
     def markExtremum(self, *markMinMax: qtc.Qt.CheckState):
@@ -703,40 +1053,55 @@ class ModelPlot(qtw.QWidget):
             return
         align = ('top', 'bottom')    # verticalalignment of min and max label
         funcs = (np.argmin, np.argmax)
-        numberOfLines = len(self.ax.lines)    # changes with plot of extrema
+        lines = self.lines    # data lines only, not the markers
+        # all lines share x (see plot_pre): float64 data converted to axis units by matplotlib
+        xUnits, yUnits = self.ax.xaxis.get_units(), self.ax.yaxis.get_units()
+        xy = np.stack([l_.get_xydata() for l_ in lines])    # (lines, points, x/y)
+        xall, yall = xy[..., 0], xy[..., 1]
+        rows = np.arange(len(lines))
         for i_ in (0,1):
             if markMinMax[i_] == qtc.Qt.Unchecked:
                 continue
-            x = y = np.empty(0)
-            for n_ in range(numberOfLines):
-                yall = self.ax.lines[n_].get_ydata()    # .get_ydata is numpy array of quantities
-                index = funcs[i_](yall)    # indices of extrema at first occurrence
-                x = np.append(x, self.ax.lines[n_].get_xdata()[index])
-                y = np.append(y, yall[index])
-                if markMinMax[i_] == qtc.Qt.Checked:
-                    self.labelPoint((x[-1].magnitude, y[-1].magnitude), align[i_])
-            label = '_' + gid + str(i_)    # label=_ does not show up in legend
-            self.ax.plot(x, y, linestyle='', marker=7-i_, color='red', label=label, gid=gid)
+            index = funcs[i_](yall, axis=1)    # indices of extrema at first occurrence
+            x, y = xall[rows, index], yall[rows, index]
+            if markMinMax[i_] == qtc.Qt.Checked:
+                for p_ in zip(x, y):
+                    self.labelPoint(p_, align[i_])
+            if self.extremaLines[i_]:
+                self.extremaLines[i_].set_data(Q_(x, xUnits), Q_(y, yUnits))
+            else:
+                label = '_' + gid + str(i_)    # label=_ does not show up in legend
+                self.extremaLines[i_], = self.ax.plot(Q_(x, xUnits), Q_(y, yUnits), linestyle='',
+                                                      marker=7-i_, color='red', label=label, gid=gid,
+                                                      animated=True)
 
     def markCalculation(self, mark: qtc.Qt.CheckState):
         gid = 'calc'    # gid: custom id
+        self.calcMark = (mark, self.page.calcPoint)
         # reset marker
         if self.ax.lines[-1].get_gid() == gid:
             self.ax.lines[-1].remove()    # remove old markers
-            self.ax.legend()    # update legend
+            self.legendDirty = True
         if self.overlay:
             self.overlay.remove()    # remove old annotation
             self.overlay = []
-        if mark == qtc.Qt.Unchecked:
-            return
-        # set marker
-        parent = self.parent()
-        xs, y = parent.calcPoint    # with all possible x values
-        x = xs[parent.plotX]
-        self.ax.plot(x, y, 'x', color='red', label=self.legendText(xs), gid=gid)
-        self.ax.legend()    # update legend
-        if mark == qtc.Qt.Checked:
-            self.overlay = self.labelPoint((x.magnitude, y.magnitude), 'center')
+        parent = self.page
+        if mark != qtc.Qt.Unchecked and parent.calcPoint:
+            # set marker
+            xs, y = parent.calcPoint    # with all possible x values
+            x = xs[parent.plotX]
+            self.ax.plot(x, y, 'x', color='red', label=self.legendText(xs), gid=gid, animated=True)
+            self.legendDirty = True
+            if mark == qtc.Qt.Checked:
+                self.overlay = self.labelPoint((x.magnitude, y.magnitude), 'center')
+        self.updateLegend()
+
+    def updateLegend(self):
+        """Rebuild the legend only once after labeled lines were added or removed"""
+        if self.legendDirty:
+            if self.legendKeys:
+                self.ax.legend().set_animated(True)
+            self.legendDirty = False
 
     def labelPoint(self, point: tuple, align: str):
         """Annotate point's location"""
@@ -745,22 +1110,135 @@ class ModelPlot(qtw.QWidget):
         return self.ax.annotate(text, xy=point,  xycoords='data',
                     xytext=point, textcoords='data',
                     horizontalalignment='center', verticalalignment=align,
-                    )
+                    animated=True)
+
+def loadMatplotlib():
+    """Import and set up matplotlib once"""
+    global mpl, plt, FigureCanvas, NavigationToolbar
+    if mpl is None:
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qtagg import (
+            FigureCanvas, NavigationToolbar2QT as NavigationToolbar)
+        # https://matplotlib.org/stable/gallery/user_interfaces/embedding_in_qt_sgskip.html
+        if EXECUTABLE_BUNDLE:
+            # BUG: bugfixes and improvements for executables:
+            import matplotlib.backends.backend_pdf    # make the 'Save the figure -> pdf' work
+        plt.rcParams['axes.formatter.use_locale'] = True    # plot localisation
+        plt.style.use('fast')    # path simplification and chunking for faster drawing
+        ureg.setup_matplotlib()    # https://pint.readthedocs.io/en/stable/plotting.html
+
+def libraryInfos():
+    """Versions of the used libraries (imports matplotlib if not done yet)"""
+    loadMatplotlib()
+    return ['Qt ' + qtc.QLibraryInfo.version().toString(),
+        'Matplotlib ' + mpl.__version__,
+        'Numpy ' + np.__version__,
+        'Pint ' + pint.__version__]
+
+def loadModel(path: Path):
+    """Import model file as module, reuse the module while the file is unchanged"""
+    name = f'{MODEL_FOLDER}.{path.stem}'
+    mtime = path.stat().st_mtime_ns
+    module = sys.modules.get(name)
+    if module is None or g_modelmtimes.get(path) != mtime:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)    # uses cached bytecode
+        except BaseException:
+            del sys.modules[name]
+            raise
+        g_modelmtimes[path] = mtime
+    return module
+
+@functools.cache
+def noCommaValidator():
+    """Do not allow commas, compiled once and shared by the line edits of all tabs"""
+    # [^]: any char but, *: any times (empty -> setText(placeholderText()))
+    return qtg.QRegularExpressionValidator(qtc.QRegularExpression('[^,]*'))
+
+@functools.cache
+def themeIcon(name: qtg.QIcon.ThemeIcon, fallback: qtw.QStyle.StandardPixmap):
+    """Native icon with built-in Qt icon as fallback, created once for all tabs"""
+    return qtg.QIcon.fromTheme(name, qtw.QApplication.style().standardIcon(fallback))
+
+# 'number unit' as in the input fields (e.g. '1.5e3 W/m^2'), see parseQuantity
+g_quantityPattern = re.compile(r'([+-]?(?:(?:0|[1-9]\d*)(?:\.\d*)?|\.\d+)([eE][+-]?\d+)?)\s*(.*)')
+
+@functools.lru_cache(maxsize=1024)
+def parseQuantity(text: str):
+    """Parse text to a quantity, reuse the result of equal texts (do not modify in place)"""
+    match = g_quantityPattern.fullmatch(text)
+    if match:
+        # fast path: number and a plain unit, without pint's expression parser
+        number, exponent, unit = match.groups()
+        try:
+            if '.' in number or exponent or any(c_ in unit for c_ in './-'):
+                # pint's parser divides and takes negative or fractional powers as float
+                number = float(number)
+            else:
+                number = int(number)    # same type as pint's parser
+            return Q_(number, parseUnit(unit)) if unit else Q_(number)
+        except Exception:
+            pass    # e.g. expressions like '1 m + 2 cm'
+    return Q_(text)
+
+@functools.lru_cache(maxsize=256)
+def parseUnit(text: str):
+    """Parse a unit string once"""
+    return ureg.Unit(text)
+
+@functools.lru_cache(maxsize=256)
+def baseFactor(units: str):
+    """Factor and base units to convert magnitudes in units, None if not multiplicative"""
+    try:
+        zero, one = Q_(0.0, units).to_base_units(), Q_(1.0, units).to_base_units()
+    except Exception:
+        return None
+    if zero.magnitude != 0:
+        return None    # offset units (e.g. degC) need pint's conversion
+    return one.magnitude, one.units
+
+def toBaseUnits(q):
+    """q.to_base_units() with the conversion factor looked up once per unit"""
+    factor = baseFactor(str(q.units))
+    if factor is None:
+        return q.to_base_units()
+    return Q_(q.magnitude * factor[0], factor[1])
+
+def quantityKey(q):
+    """Hashable key of a quantity, arrays by their data (str() abbreviates long arrays)"""
+    if isinstance(q.magnitude, np.ndarray):
+        return (q.magnitude.tobytes(), q.magnitude.dtype.str, q.magnitude.shape, str(q.units))
+    return str(q)
+
+@functools.lru_cache(maxsize=32)
+def loadPixmap(path: str, mtime: float, ratio: float):
+    """Decode and scale an image once for all tabs and options (a new mtime reloads it)"""
+    pixmap = qtg.QPixmap(path)
+    if not pixmap.isNull():
+        pixmap.setDevicePixelRatio(ratio)    # use high-DPI displays
+        if pixmap.height() > MAX_IMAGE_HEIGHT:
+            pixmap = pixmap.scaledToHeight(MAX_IMAGE_HEIGHT, qtc.Qt.SmoothTransformation)
+    return pixmap
+
+def linspace(start, stop, num: int):
+    """Evenly spaced quantities in units of start (numpy.linspace on magnitudes)"""
+    # np.linspace on quantities dispatches through pint's __array_function__
+    units = start.units
+    stop = stop.magnitude if stop.units == units else stop.m_as(units)    # usually same units
+    return Q_(np.linspace(start.magnitude, stop, num), units)
 
 def htmlTable(table: tuple):
     """Convert tuple of tuples for row and column into html representation"""
-    text = ''
-    for row in table:
-        style, colspan = '', ''
-        if not text:
-            style = ' style="vertical-align:bottom"'    # first row
-        text += '<tr>'
-        for col in row:
-            if len(row) == 1:
-                colspan = ' colspan="2"'
-            text += '<td' + style + colspan + '>' + col + '</td>'
-        text += '</tr>'
-    return '<table>' + text + '</table>'
+    rows = []
+    for n_, row in enumerate(table):
+        style = ' style="vertical-align:bottom"' if n_ == 0 else ''    # first row
+        colspan = ' colspan="2"' if len(row) == 1 else ''
+        rows.append('<tr>' + ''.join(f'<td{style}{colspan}>{col}</td>' for col in row) + '</tr>')
+    return '<table>' + ''.join(rows) + '</table>'
 
 class DimensionalityException(Exception):
     def __init__(self, units):
@@ -60,9 +60,11 @@ input['z'] = ('Halbe Balkendicke',      (3), 'cm', option['output'][1])
 
 # Diagramm: Größe auf der x-Achse
 plotX = 'x'
+# Berechnung ohne pint: Eingaben und Ergebnis als Zahlenwerte in SI-Basiseinheiten
+unitless = {'−Durchbiegung': 'm', 'Max. Biegespannung': 'kg/m/s^2'}
 
 # --- Modellberechnung ---
-import model.f_helper as hp    # helper functions
+import numpy as np    # init
 
 def calculate(Q_, var, opt):    # init
     # Konstanten
@@ -85,65 +87,65 @@ def calculate(Q_, var, opt):    # init
     elif opt['Last'] == 'Einzellast':
         if opt['output'] == '−Durchbiegung':
             k = var['F'] * var['l']**3 * var['a'] * (1-var['a']) / EI / 6
-            return -k * hp.piecewise(f1_Einzellast, var, ('a', 'x'))
+            return -k * f1_Einzellast(var, var['a'], var['x'])
         else:
             # Maximale Biegespannung (in der Randfaser)
-            My = var['F'] * var['l'] * hp.piecewise(f2_Einzellast, var, ('a', 'x'))
+            My = var['F'] * var['l'] * f2_Einzellast(var, var['a'], var['x'])
             return My / W
     elif opt['Last'] == 'Dreieckslast':
         if opt['output'] == '−Durchbiegung':
-            return 1/EI * hp.piecewise(f1_Dreieckslast, var, ('a', 'x'))
+            return 1/EI * f1_Dreieckslast(var, var['a'], var['x'])
         else:
             # Maximale Biegespannung (in der Randfaser)
-            My = hp.piecewise(f2_Dreieckslast, var, ('a', 'x'))
+            My = f2_Dreieckslast(var, var['a'], var['x'])
             return My / W
 
 def f1_Einzellast(_, a, x):
-    if a < x <= 1:
-        a = 1 - a
-        x = 1 - x
+    rechts = (a < x) & (x <= 1)    # rechts der Last: gespiegelt
+    a = np.where(rechts, 1 - a, a)
+    x = np.where(rechts, 1 - x, x)
     return (2-a)*x - x**3 /a
 
 def f2_Einzellast(_, a, x):
-    if a < x <= 1:
-        a = 1 - a
-        x = 1 - x
+    rechts = (a < x) & (x <= 1)    # rechts der Last: gespiegelt
+    a = np.where(rechts, 1 - a, a)
+    x = np.where(rechts, 1 - x, x)
     return (1-a) * x
 
 def f1_Dreieckslast(var, a, x):
     """Durchbiegung w einer Dreieckslast"""
     R = var['q'] * var['l'] / 2    # Resultierende Last
-    if a == 1 - a:
-        L = R / 2    # Last je Auflager bei a = 1/2
-        c1 = (1/192 * R/a - 1/8 * L)    # Randbedingung w(a)=w(b) und w'(a)=0
-        if x > a:
-            x = 1 - x
-    else:
-        b = 1 - a    # a + b == 1
-        B = R * (2/3 * a + 1/3 * b)    # Auflager B
-        A = R - B    # Auflager A
+    b = 1 - a    # a + b == 1
+    B = R * (2/3 * a + 1/3 * b)    # Auflager B
+    A = R - B    # Auflager A
 
-        # Randbedingung w(a)=w(b) und w'(a)=-w'(b) wg. Koordinatensystem
-        c1 = -1/2*(A*a**2+B*b**2)*b + 1/12*R*(a**3+b**3)*b - 1/6*(A*a**3-B*b**3) + 1/60*R*(a**4-b**4)
-        c1 = c1 / (a + b)
-        c3 = -1/2 * (A*a**2 + B*b**2) + 1/12 * R * (a**3 + b**3) - c1
+    # Randbedingung w(a)=w(b) und w'(a)=-w'(b) wg. Koordinatensystem
+    c1 = -1/2*(A*a**2+B*b**2)*b + 1/12*R*(a**3+b**3)*b - 1/6*(A*a**3-B*b**3) + 1/60*R*(a**4-b**4)
+    c1 = c1 / (a + b)
+    c3 = -1/2 * (A*a**2 + B*b**2) + 1/12 * R * (a**3 + b**3) - c1
 
-        if x <= a:
-            L = A
-        else:
-            L = B
-            c1 = c3
-            x = 1 - x
-            a = 1 - a    # a + b == 1
-    return (1/6 * L * x**3 - 1/60 * R/a * x**5 + c1 * x) * var['l']**3
+    mitte = a == b    # a = 1/2
+    if np.any(mitte):
+        L = R / 2    # Last je Auflager bei a = 1/2
+        A = np.where(mitte, L, A)
+        B = np.where(mitte, L, B)
+        c1 = np.where(mitte, 1/192 * R/a - 1/8 * L, c1)    # Randbedingung w(a)=w(b) und w'(a)=0
+        c3 = np.where(mitte, c1, c3)
+
+    rechts = x > a    # rechts der Last: gespiegelt
+    L = np.where(rechts, B, A)
+    c1 = np.where(rechts, c3, c1)
+    x = np.where(rechts, 1 - x, x)
+    a = np.where(rechts, b, a)
+    # Horner-Schema von 1/6*L*x^3 - 1/60*R/a*x^5 + c1*x
+    x2 = x * x
+    return x * (c1 + x2 * (L/6 - R/(60*a) * x2)) * var['l']**3
 
 def f2_Dreieckslast(var, a, x):
     """Biegemoment My einer Dreieckslast"""
     R = var['q'] * var['l'] / 2    # Resultierende Last
-    if x <= a:
-        L = R * (2/3 - 1/3 * a)    # Auflager A
-    else:
-        L = R * (1/3 + 1/3 * a)    # Auflager B
-        x = 1 - x
-        a = 1 - a    # a + b == 1
+    rechts = x > a    # rechts der Last: gespiegelt
+    L = np.where(rechts, R * (1/3 + 1/3 * a), R * (2/3 - 1/3 * a))    # Auflager B bzw. A
+    x = np.where(rechts, 1 - x, x)
+    a = np.where(rechts, 1 - a, a)    # a + b == 1
     return L*x*var['l'] - 1/3 * R/a * x**3 * var['l']
\ No newline at end of file
@@ -61,6 +61,8 @@ input['v0'] = ('Initiale Geschwindigkeit', (0, 1, 1, 2), 'cm/s')
 
 # Diagramm: Größe auf der x-Achse
 plotX = 't'
+# Berechnung ohne pint: Eingaben und Ergebnis als Zahlenwerte in SI-Basiseinheiten
+unitless = {'Auslenkung': 'm'}
 
 # --- Modellberechnung ---
 import numpy as np    # init
@@ -78,20 +80,22 @@ def calculate(Q_, var, opt):    # init
     return hp.piecewise(pieces, var, ('D', 'w0'))
 
 def pieces(var, D, w0):
+    t = var['t']
     if D < w0:
         # Schwingfall
         wd = np.sqrt(np.square(w0) - np.square(D))
-        tmp = var['v0'] + D * var['x0']
-        tmp *= 1.0/wd * np.sin(wd * var['t'])
-        tmp += var['x0'] * np.cos(wd * var['t'])
+        wdt = wd * t    # Argument für sin und cos
+        tmp = (var['v0'] + D * var['x0']) / wd * np.sin(wdt)
+        tmp += var['x0'] * np.cos(wdt)
     elif D == w0:
         # Aperiodischer Grenzfall
         tmp = var['v0'] + D * var['x0']
-        tmp = var['x0'] + tmp * var['t']
+        tmp = var['x0'] + tmp * t
     else:
         # Kriechfall
         alpha = np.sqrt(np.square(D) - np.square(w0))
         c1 = (var['v0'] + var['x0']*alpha + var['x0']*D) / (2*alpha)
         c2 = var['x0'] - c1
-        tmp = c1 * np.exp(alpha*var['t']) + c2 * np.exp(-alpha*var['t'])
-    return np.exp(-D*var['t']) * tmp
+        # Abklingen exp(-D*t) in den Exponenten zusammengefasst (kein Überlauf von exp(alpha*t))
+        return c1 * np.exp((alpha-D) * t) + c2 * np.exp(-(alpha+D) * t)
+    return np.exp(-D*t) * tmp
@@ -68,6 +68,10 @@ input['c'] = ('Stoffmengenkonzentration', (55.42, 55.42, 0.02), 'mol/l', 'Flüss
 
 # Diagramm: Größe auf der x-Achse
 plotX = 'd'
+# Kurvenscharen in einem Aufruf berechnen (calculate rechnet elementweise)
+batch = True
+# Berechnung ohne pint: Eingaben und Ergebnis als Zahlenwerte in SI-Basiseinheiten
+unitless = {'Intensität': 'W/m^2', 'Abschwächung': ''}
 
 # --- Modellberechnung ---
 import numpy as np    # init
@@ -84,9 +88,9 @@ def calculate(Q_, var, opt):    # init
     else:
         # Flüssigkeit/Gas
         E = var['ε_λ'] * var['c'] * var['d']    # Extinktion
-        A = np.power(10, -E)
+        A = np.exp(-np.log(10) * E)    # 10^-E, exp ist schneller als power
 
     if opt['output'] == 'Intensität':
-        return var['I_0'].to('W/m^2') * A
+        return var['I_0'] * A
     else:
         return A
\ No newline at end of file
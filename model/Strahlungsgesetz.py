@@ -50,23 +50,43 @@ input['T'] = ('Temperatur', (250, 325, 400), 'K')
 
 # Diagramm: Größe auf der x-Achse
 plotX = 'λ'
+# Berechnung ohne pint: Eingaben und Ergebnis als Zahlenwerte in SI-Basiseinheiten
+unitless = {'Spektrale Strahldichte': 'W/m^3/sr', 'Strahldichte': 'W/m^2/sr'}
 
 # --- Modellberechnung ---
 import numpy as np    # init
 import model.f_helper as hp    # helper functions
 
+# Planck-Konstanten (Festlegung nach CODATA 2018), einmal beim Laden berechnet
+c1L = 2 * 6.62607015e-34 * 299792458**2    # c1L = 2*h*c^2 in W*m^2/sr
+c2  = 6.62607015e-34 * 299792458 / 1.380649e-23    # c2 = h*c/k in m*K
+
 def calculate(Q_, var, opt):    # init
+    # Konstanten
+    #   c = Q_(value, 'unit')
+    # c1L, c2: siehe oben
 
     def Plancks_Law(var):
-        # Konstanten
-        #   c = Q_(value, 'unit')
-        # Planck-Konstanten (Festlegung nach CODATA 2018)
-        c1L = Q_(2 * 6.62607015e-34 * 299792458**2, 'W*m^2/sr')    # c1L = 2*h*c^2
-        c2  = Q_(6.62607015e-34 * 299792458 / 1.380649e-23, 'm*K')    # c2 = h*c/k
-        return c1L / var['λ']**5 / np.expm1(c2/var['λ']/var['T'])
+        λ = var['λ']
+        λ2 = λ * λ    # λ^5 als Produkt (schneller als power)
+        return c1L / (λ2 * λ2 * λ) / np.expm1(c2/(λ*var['T']))
+
+    def Plancks_Integral(x0, x1):
+        # Integral über λ mit x = c2/(λ*T): c1L*T^4/c2^4 * (G(x1) - G(x0)),
+        # G(x) = ∫x..∞ t^3/(e^t-1) dt = Σn e^(-nx) ((nx)^3 + 3(nx)^2 + 6nx + 6) / n^4
+        def G(x):
+            n = np.arange(1, int(np.ceil(37 / np.min(x))) + 1)    # Restglied < e^-36
+            nx = np.multiply.outer(x, n)
+            return np.sum(np.exp(-nx) * (((nx + 3) * nx + 6) * nx + 6) / n**4, axis=-1)
+        return c1L * var['T']**4 / c2**4 * (G(x1) - G(x0))
 
     # Gleichung bzw. Algorithmus
     if opt['output'] == 'Spektrale Strahldichte':
         return Plancks_Law(var)
+    x0 = c2 / (var['F_0'] * var['T'])
+    x1 = c2 / (var['F_1'] * var['T'])
+    if min(np.min(x0), np.min(x1)) >= 1:
+        # Reihe konvergiert schnell (höchstens 37 Glieder): ohne numerische Integration
+        return Plancks_Integral(x0, x1)
     else:
         return hp.integrate(Plancks_Law, var, {'λ':'m', 'T':'K'})
\ No newline at end of file
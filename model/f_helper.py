@@ -27,33 +27,45 @@
 import numpy as np
 from typing import Callable, Sequence
 
+integrationKeys = {}    # (units, unit of x): key of the variable to integrate, see integrate
+
 def integrate(function: Callable, var: dict, units: dict):
     """Berechne das Integral von 'function'.
     Benötigt werden die Dimensionen 'units: {key: unit}' der Variablen 'var'.
+    Ohne pint (Zahlenwerte) wird über den ersten Schlüssel von 'units' integriert.
     """
-    INTEGR_DATAPOINTS = 10001    # resolution of curve to integrate with numpy.trapz
-    NUM_OF_DATAPOINTS = max(len(np.atleast_1d(v_)) for v_ in var.values())
+    INTEGR_DATAPOINTS = 10001    # resolution of curve to integrate, odd for Simpson's rule
+    var = dict(var)    # reshaped values only for the integration, caller's dict unchanged
+    # one row per integration interval, shared (1d) if the limits are scalar
     x = np.linspace(var['F_0'], var['F_1'], INTEGR_DATAPOINTS, axis=-1)
-    x = np.broadcast_to(x, (NUM_OF_DATAPOINTS, INTEGR_DATAPOINTS))
     # make other (all) values broadcastable to x
     for k_ in units:
-        if k_ in var.keys() and hasattr(var[k_].magnitude, '__len__'):
+        if k_ in var.keys() and np.ndim(var[k_]):
             # keep scalar, modify vector
             var[k_] = np.transpose(np.atleast_2d(var[k_]))
-    # search for dimension to integrate
-    for k_ in units:
-        if x.check(units[k_]):
-            var[k_] = x
-            break
-    return np.trapz(function(var), x)
+    # search for dimension to integrate (magnitudes without pint: first key)
+    if hasattr(x, 'check'):
+        cacheKey = (tuple(units.items()), str(x.units))
+        if cacheKey not in integrationKeys:
+            # dimension check only once per combination of units
+            integrationKeys[cacheKey] = next((k_ for k_ in units if x.check(units[k_])), None)
+        key = integrationKeys[cacheKey]
+    else:
+        key = next(iter(units), None)
+    if key is not None:
+        var[key] = x
+    # Simpson's rule on the uniform grid: h/3 * (1, 4, 2, 4, …, 2, 4, 1)
+    weights = np.full(INTEGR_DATAPOINTS, 2.0)
+    weights[1::2] = 4
+    weights[[0, -1]] = 1
+    h = (x[..., -1] - x[..., 0]) / (INTEGR_DATAPOINTS - 1)
+    return np.sum(function(var) * weights, axis=-1) * h / 3
 
 def piecewise(function: Callable, var: dict, keys: Sequence[str]):
     """Iteriere 'function' über abschnittsweise definierte Variablen namens 'keys'"""
-    import itertools
     ndvars = [np.atleast_1d(var[k_]) for k_ in keys]    # make iterable objects
     length = max(len(n_) for n_ in ndvars)    # max. number of values
     ndvars = [np.resize(n_, length) for n_ in ndvars]    # fill up small array with repeated copies
-    array = np.array([])
-    for v_ in itertools.zip_longest(*ndvars):
-        array = np.append(array, function(var, *v_))
-    return array
\ No newline at end of file
+    # every call returns a whole (vectorized) series, join them once at the end
+    arrays = [np.ravel(function(var, *v_)) for v_ in zip(*ndvars)]
+    return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
\ No newline at end of file